@@ -1,8 +1,16 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import yfinance as yf
 import altair as alt
+import os
+import json
+import time
+import threading
+import functools
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 
 st.set_page_config(page_title="My Portfolio Tracker", layout="wide")
@@ -16,6 +24,22 @@ Upload your Trading 212 CSV file to see:
 - Projected DRIP growth
 """)
 
+# CSV reader, using the multithreaded pyarrow parser when it is available.
+# All files go through one engine so their dtypes match for dedup.
+def read_csvs(files):
+    try:
+        return [pd.read_csv(file, engine="pyarrow", dtype_backend="pyarrow") for file in files]
+    except (ImportError, TypeError, ValueError):
+        for file in files:
+            file.seek(0)
+        return [pd.read_csv(file) for file in files]
+
+# CSV export, keyed on a content hash so reruns reuse the encoded bytes.
+# Only the current upload set matters, so keep just a few entries.
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_csv_bytes(df_hash, columns, _df):
+    return _df.to_csv(index=False).encode('utf-8')
+
 # Sidebar
 # Upload CVSs, combine and remove duplicates
 dataframes = []
@@ -25,18 +49,21 @@ uploaded_files = st.sidebar.file_uploader(
 )
 
 if uploaded_files:
-    dataframes = [pd.read_csv(file) for file in uploaded_files]
+    dataframes = read_csvs(uploaded_files)
     combined_df = pd.concat(dataframes, ignore_index=True)
 
     before = combined_df.shape[0]
-    combined_df = combined_df.drop_duplicates(ignore_index=True)
+    # Transactions are identified by these columns; hash only those
+    key_cols = [c for c in ("Time", "Action", "Ticker", "No. of shares", "Price / share", "ID") if c in combined_df.columns]
+    combined_df = combined_df.drop_duplicates(subset=key_cols or None, ignore_index=True)
     after = combined_df.shape[0]
     st.success("CSV files combined successfully!")
 
     st.write("Below is the combined data from all uploaded CSV files. You can review your tickers, shares, and transactions.")
     st.dataframe(combined_df)
     
-    csv = combined_df.to_csv(index=False).encode('utf-8')
+    df_hash = pd.util.hash_pandas_object(combined_df, index=True).values.tobytes()
+    csv = get_csv_bytes(df_hash, tuple(combined_df.columns), combined_df)
     st.sidebar.download_button(
         label="Download Combined CSV",
         data=csv,
@@ -50,8 +77,57 @@ base_currency = st.sidebar.selectbox("Portfolio Base Currency", ["USD", "GBP", "
 st.sidebar.subheader("DRIP Simulation")
 drip_years = st.sidebar.slider("Years to simulate", 1, 30, 5)
 
+# On-disk cache so restarts skip the network while results are fresh.
+# Only successful returns are written; a failed fetch should raise instead.
+CACHE_DIR = ".cache"
+
+def file_cache(suffix, ttl):
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = "_".join(str(a) for a in args).replace("/", "_")
+            path = os.path.join(CACHE_DIR, f"{key}_{suffix}.pkl")
+            if os.path.exists(path) and time.time() - os.path.getmtime(path) < ttl:
+                try:
+                    return pd.read_pickle(path)
+                except Exception:
+                    pass
+            result = func(*args)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            pd.to_pickle(result, tmp_path)
+            os.replace(tmp_path, path)
+            return result
+        return wrapper
+    return decorator
+
+# Tickers known to pay no dividends, kept for a week so new sessions skip them
+NO_DIV_PATH = os.path.join(CACHE_DIR, "no_div.json")
+NO_DIV_TTL = 60 * 60 * 24 * 7
+
+def load_no_div_cache():
+    try:
+        with open(NO_DIV_PATH) as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    now = time.time()
+    return {t: ts for t, ts in entries.items() if isinstance(ts, (int, float)) and now - ts < NO_DIV_TTL}
+
+def save_no_div_cache(entries):
+    # Merge with entries other sessions wrote meanwhile, then swap the file in atomically
+    merged = {**load_no_div_cache(), **entries}
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = f"{NO_DIV_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(merged, f)
+    os.replace(tmp_path, NO_DIV_PATH)
+
 # FX rate
-@st.cache_data(show_spinner=False)
+@st.cache_data(show_spinner=False, ttl=60 * 60)
+@file_cache("fx", ttl=60 * 60)
 def get_fx_rate(from_ccy, to_ccy):
     if from_ccy == to_ccy:
         return 1
@@ -59,80 +135,109 @@ def get_fx_rate(from_ccy, to_ccy):
     fx = yf.Ticker(ticker)
     hist = fx.history(period="5d")
     if hist.empty:
-        return 1
+        raise ValueError(f"No FX history for {ticker}")
     return hist["Close"].iloc[-1]
 
 # Dividend historical info
-@st.cache_data(show_spinner=False)
+# Fetch errors propagate so they are never cached or mistaken for "no dividends"
+@st.cache_data(show_spinner=False, ttl=60 * 60 * 24)
+@file_cache("dividends", ttl=60 * 60 * 24)
 def get_dividend_history(ticker):
-    try:
-        stock = yf.Ticker(ticker)
-        dividends = stock.dividends
-        if dividends.empty:
-            return pd.Series(dtype=float)
-        dividends.index = dividends.index.tz_localize(None)
-        return dividends
-    except Exception:
+    stock = yf.Ticker(ticker)
+    dividends = stock.dividends
+    if dividends.empty:
         return pd.Series(dtype=float)
+    dividends.index = dividends.index.tz_localize(None)
+    return dividends
+
+# Last close price; errors (including an empty history) propagate uncached
+@st.cache_data(show_spinner=False, ttl=60 * 60)
+def get_last_price(ticker):
+    return yf.Ticker(ticker).history(period="5d")["Close"].iloc[-1]
+
+# Last close prices for all holdings in one batched request; a failed
+# download raises so it is not cached
+@st.cache_data(show_spinner=False, ttl=60 * 60)
+def get_last_prices(tickers):
+    bulk = yf.download(list(tickers), period="5d", group_by="ticker", threads=True, progress=False)
+    prices = {}
+    for t in tickers:
+        try:
+            frame = bulk[t] if isinstance(bulk.columns, pd.MultiIndex) else bulk
+            close = frame["Close"].dropna()
+        except KeyError:
+            continue
+        if not close.empty:
+            prices[t] = close.iloc[-1]
+    return prices
 
 # Dividend CAGR
 def calculate_dividend_cagr(dividends, years=5):
     if dividends.empty:
         return 0
-    payment_dates=None
-    if not dividends.empty:
-        payment_dates = pd.to_datetime(payment_dates)
-    dividends = pd.Series(dividends, index=payment_dates)
-    yearly_groups = dividends.resample("Y")
-    annual = yearly_groups.sum()
-    
+    # Annual sums via bincount on calendar year
+    years_idx = dividends.index.year.to_numpy()
+    vals = dividends.to_numpy()
+    annual = np.bincount(years_idx - years_idx.min(), weights=vals)
+
     annual = annual[annual > 0]
-    if len(annual) < 2:
+    if annual.size < 2:
         return 0
-    start = annual.iloc[-min(years, len(annual))]
-    end = annual.iloc[-1]
-    n = len(annual) - 1
+    start = annual[-min(years, annual.size)]
+    end = annual[-1]
+    n = annual.size - 1
     if start <= 0 or n <= 0:
         return 0
     return (end / start) ** (1 / n) - 1
 
 # DRIP Simulation
+# Reinvesting each year gives s_t = s_0 * (1 + d/p)**t. Accepts scalars or
+# equal-length arrays; arrays return one row per holding.
 def simulate_drip(shares, annual_dividend, price, years):
-    shares_over_time = [shares]
-    yearly_income = []
-    for _ in range(years):
-        income = shares * annual_dividend
-        yearly_income.append(income)
-        # reinvest
-        new_shares = income / price
-        shares =shares + new_shares
-        shares_over_time.append(shares)
+    shares = np.asarray(shares, dtype=float)[..., None]
+    annual_dividend = np.asarray(annual_dividend, dtype=float)[..., None]
+    growth = 1.0 + annual_dividend / np.asarray(price, dtype=float)[..., None]
+    shares_over_time = shares * growth ** np.arange(years + 1)
+    yearly_income = shares_over_time[..., :-1] * annual_dividend
     return shares_over_time, yearly_income
 
 
+# Column detection, cached across reruns on the sorted column names
+@st.cache_data(show_spinner=False)
+def detect_columns(cols_tuple):
+    cols = set(cols_tuple)
+    ticker_col = next((c for c in ("Ticker", "Stock Ticker", "Instrument") if c in cols), None)
+    qty_col = next((c for c in ("No. of shares", "Shares", "Shares Owned") if c in cols), None)
+    action_col = next((c for c in ("Action", "Type", "Transaction Type") if c in cols), None)
+    return ticker_col, qty_col, action_col
+
+
 # Main
 if not combined_df.empty:
-    ticker_col = "Ticker"
-    qty_col = "No. of shares"
-    action_col = "Action"
+    ticker_col, qty_col, action_col = detect_columns(tuple(sorted(combined_df.columns)))
+    if ticker_col is None or qty_col is None:
+        st.error("Could not find a ticker and share quantity column in the uploaded CSV.")
+        st.stop()
+
+    # Categorical codes make the groupbys below hash integers instead of strings
+    combined_df[ticker_col] = combined_df[ticker_col].astype("category")
+    if action_col:
+        combined_df[action_col] = combined_df[action_col].astype("category")
 
     if action_col:
-        def signed_shares(row):
-            action = str(row[action_col]).strip().lower()
-            if "buy" in action:
-                return row[qty_col]
-            elif "sell" in action:
-                return -row[qty_col]
-            else:
-                return 0
-
-        combined_df["Signed Shares"] = combined_df.apply(signed_shares, axis=1)
+        # Sign per distinct action, then broadcast through the category codes;
+        # the trailing 0 is picked up by code -1 (missing action)
+        act = combined_df[action_col].cat.categories.astype(str).str.lower()
+        cat_sign = np.where(act.str.contains("buy"), 1, np.where(act.str.contains("sell"), -1, 0))
+        sign = np.append(cat_sign, 0)[combined_df[action_col].cat.codes.to_numpy()]
+        qty = combined_df[qty_col].to_numpy(dtype=float, na_value=np.nan)
+        combined_df["Signed Shares"] = sign * qty
         share_col = "Signed Shares"
     else:
         st.warning("No Sell Action column detected.")
         share_col = qty_col
 
-    grouped=combined_df.groupby(ticker_col)
+    grouped=combined_df.groupby(ticker_col, observed=True)
     shares_by_ticker = grouped[share_col]
     sum_of_shares = shares_by_ticker.sum()
     sum_of_shares = sum_of_shares.reset_index()
@@ -142,19 +247,25 @@ if not combined_df.empty:
             share_col: "Shares"
         }
     )
+    # One row per holding from here on; plain strings for yfinance and dict lookups
+    sum_of_shares["Ticker"] = sum_of_shares["Ticker"].astype(str)
     df = sum_of_shares
 
-    positive_df = df[df["Shares"] > 0]
-    if positive_df.empty:
+    # Ignore float noise left over from fully sold positions
+    positive_df = df[df["Shares"] > 1e-9]
+    df = positive_df
+    if df.empty:
         st.info("No holdings detected.")
     else:
-        df = positive_df
         st.success(f"Processed {len(df)} tickers with positive holdings.")
 
     # Portfolio Share Distribution 
     st.subheader("Portfolio Share Distribution")
     df["Share %"] = (df["Shares"] / df["Shares"].sum()) * 100
-    st.dataframe(df[["Ticker", "Shares", "Share %"]].style.format({"Shares": "{:.2f}", "Share %": "{:.2f}%"}))
+    st.dataframe(df[["Ticker", "Shares", "Share %"]], column_config={
+        "Shares": st.column_config.NumberColumn(format="%.2f"),
+        "Share %": st.column_config.NumberColumn(format="%.2f%%")
+    })
 
     # Pie chart visualisation
     share_pie = alt.Chart(df).mark_arc().encode(
@@ -182,78 +293,148 @@ if not combined_df.empty:
     if df.empty:
         st.info("No holdings after processing buy/sell actions.")
     else:
-        df["Annual Dividend / Share"] = 0.0
-        df["Annual Income"] = 0.0
-        df["Dividend CAGR %"] = 0.0
-        df["Shares After DRIP"] = 0.0
-        df["Income After DRIP"] = 0.0
-
-        monthly_income = {}
-        calendar_rows = []
+        annual_div_arr = np.zeros(len(df))
+        annual_inc_arr = np.zeros(len(df))
+        cagr_arr = np.zeros(len(df))
+        shares_drip = np.zeros(len(df))
+        income_drip = np.zeros(len(df))
+        paying = np.zeros(len(df), dtype=bool)
+
+        cal_cap = len(df) * 12
+        cal_tickers = np.empty(cal_cap, dtype=object)
+        cal_dates = np.empty(cal_cap, dtype="datetime64[ns]")
+        cal_months = np.empty(cal_cap, dtype=object)
+        cal_divs = np.empty(cal_cap, dtype=np.float64)
+        k = 0
+        monthly_arr = np.zeros(12)
+        no_div = load_no_div_cache()
+        no_div_size = len(no_div)
 
         with st.spinner("Fetching dividend data..."):
-            for i, row in df.iterrows():
-                dividends = get_dividend_history(row["Ticker"])
+            try:
+                prices = get_last_prices(tuple(df["Ticker"]))
+            except Exception:
+                prices = {}
+            # st.cache_data only reads and writes on threads with a script context
+            with ThreadPoolExecutor(max_workers=16, initializer=add_script_run_ctx, initargs=(None, get_script_run_ctx())) as ex:
+                div_futs = {t: ex.submit(get_dividend_history, t) for t in df["Ticker"] if t not in no_div}
+                # Fall back to single lookups for tickers missing from the batch
+                price_futs = {t: ex.submit(get_last_price, t) for t in df["Ticker"] if t not in prices}
+            for t, fut in price_futs.items():
+                try:
+                    prices[t] = fut.result()
+                except Exception:
+                    # Treat as unpriced for this run only
+                    prices[t] = 0
+
+            # Dividend indexes are sorted, so the trailing 12 months is a binary search
+            cutoff = pd.Timestamp(datetime.today() - timedelta(days=365))
+            for i, (ticker, shares) in enumerate(df[["Ticker", "Shares"]].itertuples(index=False, name=None)):
+                if ticker in no_div:
+                    continue
+                try:
+                    dividends = div_futs[ticker].result()
+                except Exception:
+                    # Fetch failed; retry next run rather than recording a non-payer
+                    continue
                 if dividends.empty:
+                    no_div[ticker] = time.time()
                     continue
+                paying[i] = True
 
-                last_12m = dividends[dividends.index >= datetime.today() - timedelta(days=365)]
+                start = dividends.index.searchsorted(cutoff)
+                last_12m = dividends.iloc[start:]
                 annual_div = last_12m.sum()
                 cagr = calculate_dividend_cagr(dividends)
 
-                # Monthly calendar
-                for date, value in last_12m.items():
-                    future_date = date + pd.DateOffset(years=1)
-                    calendar_rows.append({
-                        "Ticker": row["Ticker"],
-                        "Date": future_date.normalize(),
-                        "Month": future_date.strftime("%Y-%m"),
-                        "Dividend": value * row["Shares"]
-                    })
-                    month = date.strftime("%b")
-                    monthly_income[month] = monthly_income.get(month, 0) + value * row["Shares"]
-
-                df.at[i, "Annual Dividend / Share"] = annual_div
-                df.at[i, "Annual Income"] = annual_div * row["Shares"]
-                df.at[i, "Dividend CAGR %"] = cagr * 100
-
-                # DRIP simulation
-                try:
-                    price = yf.Ticker(row["Ticker"]).history(period="5d")["Close"].iloc[-1]
-                except Exception:
-                    price = 0
-                if price > 0:
-                    shares_path, income_path = simulate_drip(row["Shares"], annual_div, price, drip_years)
-                    df.at[i, "Shares After DRIP"] = shares_path[-1]
-                    df.at[i, "Income After DRIP"] = income_path[-1]
-
-        calendar_df = pd.DataFrame(calendar_rows).groupby(["Month", "Ticker"], as_index=False)["Dividend"].sum().sort_values("Month")
-
-        # Currency conversion
-        fx_rate = get_fx_rate("USD", base_currency)
-        df["Annual Income"] *= fx_rate
-        df["Income After DRIP"] *= fx_rate
-        monthly_df = pd.DataFrame(list(monthly_income.items()), columns=["Month", "Income"]).assign(Income=lambda x: x["Income"] * fx_rate)
+                # Monthly calendar, growing the buffers for frequent payers
+                if k + len(last_12m) > cal_cap:
+                    cal_cap = max(2 * cal_cap, k + len(last_12m))
+                    cal_tickers, cal_dates, cal_months, cal_divs = (
+                        np.resize(a, cal_cap) for a in (cal_tickers, cal_dates, cal_months, cal_divs)
+                    )
+                future_idx = last_12m.index + pd.DateOffset(years=1)
+                n = len(last_12m)
+                cal_tickers[k:k + n] = ticker
+                cal_dates[k:k + n] = future_idx.normalize().to_numpy()
+                cal_months[k:k + n] = future_idx.strftime("%Y-%m").to_numpy()
+                cal_divs[k:k + n] = last_12m.to_numpy() * shares
+                np.add.at(monthly_arr, last_12m.index.month.to_numpy() - 1, cal_divs[k:k + n])
+                k += n
+
+                annual_div_arr[i] = annual_div
+                annual_inc_arr[i] = annual_div * shares
+                cagr_arr[i] = cagr * 100
+
+            if len(no_div) > no_div_size:
+                save_no_div_cache(no_div)
+
+        # DRIP simulation for all priced holdings at once
+        price_arr = df["Ticker"].map(prices).fillna(0).to_numpy(dtype=float)
+        priced = price_arr > 0
+        shares_arr = df["Shares"].to_numpy(dtype=float)
+        # Unpriced holdings can't reinvest, so they stay flat at their current shares
+        drip_shares = np.repeat(shares_arr[:, None], drip_years + 1, axis=1)
+        drip_income = np.zeros((len(df), drip_years))
+        drip_shares[priced], drip_income[priced] = simulate_drip(
+            shares_arr[priced],
+            annual_div_arr[priced],
+            price_arr[priced],
+            drip_years
+        )
+        simulated = priced & paying
+        shares_drip[simulated] = drip_shares[simulated, -1]
+        income_drip[simulated] = drip_income[simulated, -1]
+
+        # Currency conversion, applied to the raw arrays before they become columns
+        try:
+            fx_rate = get_fx_rate("USD", base_currency)
+        except Exception:
+            st.warning(f"Could not fetch the USD/{base_currency} rate; showing amounts in USD.")
+            fx_rate = 1
+        annual_inc_arr *= fx_rate
+        income_drip *= fx_rate
+
+        df["Annual Dividend / Share"] = annual_div_arr
+        df["Annual Income"] = annual_inc_arr
+        df["Dividend CAGR %"] = cagr_arr
+        df["Shares After DRIP"] = shares_drip
+        df["Income After DRIP"] = income_drip
+
+        calendar_raw = pd.DataFrame({
+            "Ticker": cal_tickers[:k],
+            "Date": cal_dates[:k],
+            "Month": cal_months[:k],
+            "Dividend": cal_divs[:k]
+        })
+        calendar_df = calendar_raw.groupby(["Month", "Ticker"], as_index=False)["Dividend"].sum().sort_values("Month")
+
         month_order = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]
-        monthly_df["Month"] = pd.Categorical(monthly_df["Month"], categories=month_order, ordered=True)
-        monthly_df = monthly_df.sort_values("Month")
+        monthly_df = pd.DataFrame({
+            "Month": pd.Categorical(month_order, categories=month_order, ordered=True),
+            "Income": monthly_arr * fx_rate
+        })
 
         # Display
         st.subheader("Dividend Portfolio Overview")
-        st.dataframe(df.style.format({
-            "Annual Dividend / Share": "{:.2f}",
-            "Annual Income": "{:,.2f}",
-            "Dividend CAGR %": "{:.2f}%",
-            "Shares After DRIP": "{:.2f}",
-            "Income After DRIP": "{:,.2f}"
-        }))
+        st.dataframe(df, column_config={
+            "Shares": st.column_config.NumberColumn(format="%.2f"),
+            "Share %": st.column_config.NumberColumn(format="%.2f%%"),
+            "Annual Dividend / Share": st.column_config.NumberColumn(format="%.2f"),
+            "Annual Income": st.column_config.NumberColumn(format="%.2f"),
+            "Dividend CAGR %": st.column_config.NumberColumn(format="%.2f%%"),
+            "Shares After DRIP": st.column_config.NumberColumn(format="%.2f"),
+            "Income After DRIP": st.column_config.NumberColumn(format="%.2f")
+        })
 
         st.metric("Total Projected Annual Dividend", f"{base_currency} {df['Annual Income'].sum():,.2f}")
 
         st.subheader("Dividend Calendar – Next 12 Months")
         calendar_pivot = calendar_df.pivot(index="Month", columns="Ticker", values="Dividend").fillna(0)
         
-        st.dataframe(calendar_pivot.style.format("{:,.2f}"))
+        st.dataframe(calendar_pivot, column_config={
+            t: st.column_config.NumberColumn(format="%.2f") for t in calendar_pivot.columns
+        })
         calendar_chart = alt.Chart(calendar_df).mark_bar().encode(
             x="Month:N",
             y="Dividend:Q",
@@ -263,7 +444,7 @@ if not combined_df.empty:
         st.altair_chart(calendar_chart, use_container_width=True)
 
         calendar_daily = (
-            pd.DataFrame(calendar_rows)
+            calendar_raw
             .groupby(["Date", "Ticker"], as_index=False)["Dividend"]
             .sum()
             .sort_values("Date")
@@ -278,7 +459,9 @@ if not combined_df.empty:
             .sort_index()
         )
 
-        st.dataframe(calendar_pivot.style.format("{:,.2f}"))
+        st.dataframe(calendar_pivot, column_config={
+            t: st.column_config.NumberColumn(format="%.2f") for t in calendar_pivot.columns
+        })
 
         st.subheader("Daily Dividends List")
         
@@ -328,7 +511,7 @@ if not combined_df.empty:
             st.altair_chart(pie, use_container_width=True)
 
         st.subheader("Monthly Dividend Income Projection")
-        st.dataframe(monthly_df.style.format({"Income": "{:,.2f}"}))
+        st.dataframe(monthly_df, column_config={"Income": st.column_config.NumberColumn(format="%.2f")})
         monthly_chart = alt.Chart(monthly_df).mark_bar().encode(
             x="Month:N",
             y="Income:Q",
@@ -339,7 +522,7 @@ if not combined_df.empty:
         # DRIP Growth Projection for all stocks      
         st.subheader("Overall DRIP Growth Projection")
         drip_chart = alt.Chart(
-            pd.DataFrame({"Year": range(drip_years + 1), "Shares": shares_path})
+            pd.DataFrame({"Year": range(drip_years + 1), "Shares": drip_shares.sum(axis=0)})
         ).mark_line(point=True).encode(
             x="Year:Q",
             y="Shares:Q",
@@ -356,17 +539,12 @@ if not combined_df.empty:
 
             drip_data = []
 
-            row = df[df["Ticker"] == selected_ticker].iloc[0]
-            shares = row["Shares"]
-            annual_div = row["Annual Dividend / Share"]
-
-            try:
-                price = yf.Ticker(selected_ticker).history(period="5d")["Close"].iloc[-1]
-            except Exception:
-                price = 0
+            pos = tickers.index(selected_ticker)
+            annual_div = df["Annual Dividend / Share"].iloc[pos]
+            price = price_arr[pos]
 
         if price > 0:
-            shares_path, income_path = simulate_drip(shares, annual_div, price, drip_years)
+            shares_path = drip_shares[pos]
 
             for year, s in enumerate(shares_path):
                 drip_data.append({